@@ -2,46 +2,139 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import hashlib
 import logging
+import os
+import tempfile
+import weakref
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
+from urllib.parse import urlsplit
 
 from tzlocal import get_localzone
 
-from patchright.async_api import Browser, BrowserContext, Page, Playwright
+from patchright.async_api import Browser, BrowserContext, Page, Playwright, Route, async_playwright
+from patchright.async_api import Error as PlaywrightError
+
+from .json_utils import dumps_bytes, loads
 
 LOGGER = logging.getLogger(__name__)
 
 FINGERPRINT_SUFFIX = ".fingerprint.json"
-CHROMIUM_LAUNCH_ARGS = [
+# Flags that hide automation from bot detection. Keep these for every launch.
+_STEALTH_ARGS = [
     "--disable-blink-features=AutomationControlled",
-    "--disable-features=IsolateOrigins,site-per-process",
     "--disable-site-isolation-trials",
     "--disable-web-security",
+    "--hide-scrollbars",
+    "--mute-audio",
+    "--no-first-run",
+    # Chromium only honours the last --disable-features flag, so all disabled features go in one.
+    "--disable-features=IsolateOrigins,site-per-process,TranslateUI",
+]
+# Flags for running in containers and trimming background work.
+# `--no-zygote` and `--disable-accelerated-2d-canvas` are deliberately absent: the former makes
+# every renderer a cold process spawn, the latter forces software canvas rasterization.
+_PERF_ARGS = [
     "--no-sandbox",
     "--disable-setuid-sandbox",
     "--disable-dev-shm-usage",
-    "--disable-accelerated-2d-canvas",
-    "--no-first-run",
-    "--no-zygote",
-    # "--disable-gpu",
-    "--hide-scrollbars",
-    "--mute-audio",
     "--disable-background-networking",
     "--disable-background-timer-throttling",
     "--disable-backgrounding-occluded-windows",
     "--disable-breakpad",
     "--disable-component-extensions-with-background-pages",
     "--disable-extensions",
-    "--disable-features=TranslateUI",
     "--disable-ipc-flooding-protection",
     "--disable-renderer-backgrounding",
     "--enable-features=NetworkService,NetworkServiceInProcess",
     "--force-color-profile=srgb",
     "--metrics-recording-only",
 ]
+# Only disable the GPU on hosts that have none (e.g. `DISABLE_GPU=true` in CI containers).
+_GPU_ARGS = ["--disable-gpu"] if os.environ.get("DISABLE_GPU", "false").lower().startswith("t") else []
+CHROMIUM_LAUNCH_ARGS = _STEALTH_ARGS + _PERF_ARGS + _GPU_ARGS
+
+# Subresources that never contribute to extracted text or Markdown.
+NON_ESSENTIAL_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+# Heavy subresources that never affect DOM queries. Stylesheets are kept because `innerText`
+# (used to read result titles and snippets) depends on computed styles.
+MEDIA_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+# Analytics and ad hosts; subdomains are matched as well.
+TRACKER_HOSTS = frozenset(
+    {
+        "2mdn.net",
+        "adnxs.com",
+        "adsrvr.org",
+        "amazon-adsystem.com",
+        "amplitude.com",
+        "chartbeat.com",
+        "clarity.ms",
+        "criteo.com",
+        "doubleclick.net",
+        "facebook.net",
+        "google-analytics.com",
+        "googleadservices.com",
+        "googlesyndication.com",
+        "googletagmanager.com",
+        "googletagservices.com",
+        "hotjar.com",
+        "mixpanel.com",
+        "outbrain.com",
+        "quantserve.com",
+        "scorecardresearch.com",
+        "segment.io",
+        "taboola.com",
+    }
+)
+
+# Process-wide Playwright driver and browsers (one per headless mode), shared across calls.
+# Chromium cold start costs hundreds of milliseconds, while a new context is cheap. They belong to
+# the event loop that started them (``_PW_LOOP``) and are discarded when a call arrives on another.
+# asyncio locks bind to the first loop that waits on them, so they are recreated along with it.
+_PW_LOCK = asyncio.Lock()
+_PW: Playwright | None = None
+_PW_LOOP: asyncio.AbstractEventLoop | None = None
+_BROWSERS: dict[bool, Browser] = {}
+# Masks common automation fingerprints; injected into every new context. Every statement ends in
+# `;` or a brace, so the script is collapsed to a single line once here to shrink each CDP payload.
+_INIT_SCRIPT = "".join(
+    line.strip()
+    for line in """
+Object.defineProperty(navigator, 'webdriver', { get: () => false });
+Object.defineProperty(navigator, 'plugins', { get: () => [1, 2, 3, 4, 5] });
+Object.defineProperty(navigator, 'languages', { get: () => ['en-US', 'en'] });
+window.chrome = { runtime: {}, loadTimes: function() {}, csi: function() {}, app: {} };
+if (typeof WebGLRenderingContext !== 'undefined') {
+    const getParameter = WebGLRenderingContext.prototype.getParameter;
+    WebGLRenderingContext.prototype.getParameter = function(parameter) {
+        if (parameter === 37445) { return 'Intel Inc.'; }
+        if (parameter === 37446) { return 'Intel Iris OpenGL Engine'; }
+        return getParameter.call(this, parameter);
+    };
+}
+""".splitlines()
+)
+# Preferred color scheme for each local hour: dark from 19:00 until 07:00.
+_HOUR_COLOR = tuple("dark" if hour >= 19 or hour < 7 else "light" for hour in range(24))
+# ``Playwright.devices`` rebuilds its mapping on every access, so it is read once per driver and
+# kept here; entries go away with their Playwright instance.
+_DEVICE_CACHE: weakref.WeakKeyDictionary[Playwright, dict[str, dict[str, Any]]] = weakref.WeakKeyDictionary()
+# Read-only ``new_context`` options per device name; only the fingerprint-specific keys vary per call.
+_CONTEXT_TEMPLATES: dict[str, MappingProxyType[str, Any]] = {}
+# Digest of the bytes last written to each state/fingerprint file, used to skip no-op rewrites.
+_PERSISTED_DIGESTS: dict[Path, bytes] = {}
+# Serializes context creation per state file so concurrent calls don't race on the same files.
+_CTX_LOCKS: dict[Path, asyncio.Lock] = {}
+# Idle contexts kept per (headless, state file, locale), and how many searches a context may serve.
+POOL_SIZE = int(os.environ.get("GSEARCH_POOL_SIZE", "2"))
+MAX_USES_PER_INSTANCE = int(os.environ.get("GSEARCH_POOL_MAX_USES", "20"))
+_POOL: BrowserPool | None = None
 
 
 async def launch_browser(
@@ -58,6 +151,178 @@ async def launch_browser(
     )
 
 
+def host_is_blocked(host: str | None, blocked_hosts: frozenset[str]) -> bool:
+    """Return whether ``host`` or any of its parent domains is in ``blocked_hosts``.
+
+    >>> host_is_blocked("www.google-analytics.com", TRACKER_HOSTS)
+    True
+    >>> host_is_blocked("example.com", TRACKER_HOSTS)
+    False
+    """
+    if not host or not blocked_hosts:
+        return False
+    labels = host.lower().split(".")
+    return any(".".join(labels[i:]) in blocked_hosts for i in range(len(labels) - 1))
+
+
+async def block_resources(
+    page: Page,
+    resource_types: frozenset[str] = NON_ESSENTIAL_RESOURCE_TYPES,
+    blocked_hosts: frozenset[str] = frozenset(),
+) -> None:
+    """Abort requests from ``page`` for the given resource types or hosts; everything else continues."""
+
+    async def _filter(route: Route) -> None:
+        request = route.request
+        if request.resource_type in resource_types or host_is_blocked(urlsplit(request.url).hostname, blocked_hosts):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    await page.route("**/*", _filter)
+
+
+def _claim_running_loop() -> None:
+    """Forget the driver, browsers, pool and locks if they were created on a different event loop.
+
+    The driver's pipe is bound to the loop that started it, so once e.g. an ``asyncio.run`` call
+    returns, nothing created there can be used (or even closed) from the next loop.
+    """
+    global _PW, _PW_LOCK, _PW_LOOP, _POOL
+    loop = asyncio.get_running_loop()
+    if _PW_LOOP is loop:
+        return
+    if _PW is not None or _BROWSERS or _POOL is not None:
+        LOGGER.warning("Discarding the Playwright driver started on another event loop; starting a new one.")
+    _PW = None
+    _BROWSERS.clear()
+    _POOL = None
+    _PW_LOCK = asyncio.Lock()
+    _CTX_LOCKS.clear()
+    _PW_LOOP = loop
+
+
+async def _ensure_playwright() -> Playwright:
+    global _PW
+    if _PW is None:
+        LOGGER.info("Starting the Playwright driver...")
+        _PW = await async_playwright().start()
+    return _PW
+
+
+async def get_shared_playwright() -> Playwright:
+    """Return the shared Playwright driver for the running event loop, starting it on first use."""
+    _claim_running_loop()
+    async with _PW_LOCK:
+        return await _ensure_playwright()
+
+
+async def get_shared_browser(headless: bool) -> Browser:
+    """Return the shared Chromium instance for ``headless``, launching it on first use.
+
+    Callers own the contexts they create on the returned browser and must close them.
+    The browser itself stays alive until ``shutdown_shared_browser`` is called, or until
+    a call from a different event loop replaces it.
+    """
+    _claim_running_loop()
+    async with _PW_LOCK:
+        playwright = await _ensure_playwright()
+        browser = _BROWSERS.get(headless)
+        if browser is None or not browser.is_connected():
+            browser = await launch_browser(playwright, headless=headless)
+            _BROWSERS[headless] = browser
+        return browser
+
+
+async def shutdown_shared_browser() -> None:
+    """Close the context pool and shared browsers, and stop the Playwright driver if they were started."""
+    global _PW, _POOL
+    _claim_running_loop()
+    pool, _POOL = _POOL, None
+    if pool is not None:
+        await pool.close()
+    async with _PW_LOCK:
+        browsers = [browser for browser in _BROWSERS.values() if browser.is_connected()]
+        _BROWSERS.clear()
+        if browsers:
+            LOGGER.info("Closing %d browser(s)...", len(browsers))
+            # Independent RPCs; one browser failing to close must not keep the others open.
+            for outcome in await asyncio.gather(*(browser.close() for browser in browsers), return_exceptions=True):
+                if isinstance(outcome, Exception):
+                    LOGGER.warning("Failed to close a browser: %s", outcome)
+        if _PW is not None:
+            await _PW.stop()
+            _PW = None
+
+
+def _get_device(playwright: Playwright, name: str) -> dict[str, Any] | None:
+    devices = _DEVICE_CACHE.get(playwright)
+    if devices is None:
+        devices = _DEVICE_CACHE[playwright] = dict(playwright.devices)
+    return devices.get(name)
+
+
+def _context_template(device_name: str, device_config: dict[str, Any]) -> MappingProxyType[str, Any]:
+    template = _CONTEXT_TEMPLATES.get(device_name)
+    if template is None:
+        options = dict(device_config)
+        # Remove parameters in conflict with `no_viewport`
+        options.pop("device_scale_factor", None)
+        options.pop("deviceScaleFactor", None)
+        options.update(
+            {
+                "no_viewport": True,
+                "permissions": ["geolocation", "notifications"],
+                "accept_downloads": True,
+                "is_mobile": False,
+                "has_touch": False,
+                "java_script_enabled": True,
+            }
+        )
+        template = _CONTEXT_TEMPLATES[device_name] = MappingProxyType(options)
+    return template
+
+
+def _digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _remember_persisted(path: Path, data: bytes) -> None:
+    _PERSISTED_DIGESTS[path] = _digest(data)
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    # Write to a sibling temp file and rename it over the target, so readers never see a partial file.
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            _ = file.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _write_if_changed(path: Path, data: bytes) -> bool:
+    digest = _digest(data)
+    if _PERSISTED_DIGESTS.get(path) == digest and path.exists():
+        return False
+    _write_atomic(path, data)
+    _PERSISTED_DIGESTS[path] = digest
+    return True
+
+
+def _load_fingerprint(fingerprint_file: Path) -> dict[str, Any] | None:
+    if not fingerprint_file.exists():
+        return None
+    LOGGER.info("Loading fingerprint from %s", fingerprint_file)
+    fingerprint_bytes = fingerprint_file.read_bytes()
+    saved_state = loads(fingerprint_bytes)
+    assert isinstance(saved_state, dict)
+    _remember_persisted(fingerprint_file, fingerprint_bytes)
+    return saved_state
+
+
 async def create_browser_context(
     playwright: Playwright,
     browser: Browser,
@@ -65,91 +330,56 @@ async def create_browser_context(
     locale: str,
 ) -> tuple[BrowserContext, dict[str, Any]]:
     """Create a browser context with fingerprinting metadata restored when available."""
-    storage_state_path_str = str(state_file) if state_file.exists() else None
-
-    saved_state: dict[str, Any] = {}
     fingerprint_file = state_file.with_suffix(FINGERPRINT_SUFFIX)
-    if fingerprint_file.exists():
-        LOGGER.info("Loading fingerprint from %s", fingerprint_file)
-        with open(fingerprint_file, "r", encoding="utf-8") as file:
-            saved_state = json.load(file)
-            assert isinstance(saved_state, dict)
+    # Both probes run in worker threads, concurrently, so slow filesystems don't stall the event loop.
+    has_storage_state, loaded = await asyncio.gather(
+        asyncio.to_thread(state_file.exists),
+        asyncio.to_thread(_load_fingerprint, fingerprint_file),
+    )
+    storage_state_path_str = str(state_file) if has_storage_state else None
+    saved_state: dict[str, Any] = loaded if loaded is not None else {}
 
     device_name = saved_state.get("fingerprint", {}).get("deviceName")
-    if not device_name or device_name not in playwright.devices:
+    device_config = _get_device(playwright, device_name) if device_name else None
+    if device_config is None:
         device_name = "Desktop Chrome"
+        device_config = _get_device(playwright, device_name)
+        assert device_config is not None
 
-    device_config = playwright.devices[device_name]
-    context_options = {**device_config}
-
-    if "fingerprint" in saved_state:
-        context_options.update(
-            {
-                "locale": saved_state["fingerprint"]["locale"],
-                "timezone_id": saved_state["fingerprint"]["timezoneId"],
-                "color_scheme": saved_state["fingerprint"]["colorScheme"],
-                "no_viewport": True,
-            }
-        )
-    else:
-        now = datetime.now()
+    if "fingerprint" not in saved_state:
         current_tzinfo = get_localzone()
-        host_config = {
+        saved_state["fingerprint"] = {
             "deviceName": device_name,
             "locale": locale,
             "timezoneId": current_tzinfo.key if current_tzinfo is not None else "America/Los_Angeles",
-            "colorScheme": "dark" if 19 <= now.hour or now.hour < 7 else "light",
+            "colorScheme": _HOUR_COLOR[datetime.now().hour],
             "reducedMotion": "no-preference",
             "forcedColors": "none",
         }
-        context_options.update(
-            {
-                "locale": host_config["locale"],
-                "no_viewport": True,
-                "timezone_id": host_config["timezoneId"],
-                "color_scheme": host_config["colorScheme"],
-            }
-        )
-        saved_state["fingerprint"] = host_config
-
-    # Remove parameters in conflict with `no_viewport`
-    context_options.pop("device_scale_factor", None)
-    context_options.pop("deviceScaleFactor", None)
-
-    context_options.update(
-        {
-            "permissions": ["geolocation", "notifications"],
-            "accept_downloads": True,
-            "is_mobile": False,
-            "has_touch": False,
-            "java_script_enabled": True,
-        }
-    )
 
+    fingerprint = saved_state["fingerprint"]
+    context_options = _context_template(device_name, device_config) | {
+        "locale": fingerprint["locale"],
+        "timezone_id": fingerprint["timezoneId"],
+        "color_scheme": fingerprint["colorScheme"],
+    }
     if storage_state_path_str:
         context_options["storage_state"] = storage_state_path_str
 
     context = await browser.new_context(**context_options)
 
-    await context.add_init_script(
-        """
-        Object.defineProperty(navigator, 'webdriver', { get: () => false });
-        Object.defineProperty(navigator, 'plugins', { get: () => [1, 2, 3, 4, 5] });
-        Object.defineProperty(navigator, 'languages', { get: () => ['en-US', 'en'] });
-        window.chrome = { runtime: {}, loadTimes: function() {}, csi: function() {}, app: {} };
-        if (typeof WebGLRenderingContext !== 'undefined') {
-            const getParameter = WebGLRenderingContext.prototype.getParameter;
-            WebGLRenderingContext.prototype.getParameter = function(parameter) {
-                if (parameter === 37445) { return 'Intel Inc.'; }
-                if (parameter === 37446) { return 'Intel Iris OpenGL Engine'; }
-                return getParameter.call(this, parameter);
-            };
-        }
-        """
-    )
+    await context.add_init_script(_INIT_SCRIPT)
     return context, saved_state
 
 
+def _lock_for(path: Path) -> asyncio.Lock:
+    _claim_running_loop()
+    lock = _CTX_LOCKS.get(path)
+    if lock is None:
+        lock = _CTX_LOCKS[path] = asyncio.Lock()
+    return lock
+
+
 async def prepare_context_page(
     playwright: Playwright,
     browser: Browser,
@@ -158,28 +388,155 @@ async def prepare_context_page(
 ) -> tuple[BrowserContext, Page, dict[str, Any], Path]:
     """Construct a fresh page along with the loaded browser context and metadata."""
     state_file_path = Path(state_file)
-    context, saved_state = await create_browser_context(playwright, browser, state_file_path, locale)
+    async with _lock_for(state_file_path):
+        context, saved_state = await create_browser_context(playwright, browser, state_file_path, locale)
     page = await context.new_page()
     return context, page, saved_state, state_file_path
 
 
+class _PooledContext:
+    __slots__ = ("browser", "context", "saved_state", "uses")
+
+    def __init__(self, browser: Browser, context: BrowserContext, saved_state: dict[str, Any]) -> None:
+        self.browser = browser
+        self.context = context
+        self.saved_state = saved_state
+        self.uses = 0
+
+
+async def _close_context(context: BrowserContext) -> None:
+    LOGGER.info("Closing the context...")
+    try:
+        await context.close()
+    except PlaywrightError as exc:
+        # The browser may already be gone, taking the context with it.
+        LOGGER.debug("Ignoring error while closing a context: %s", exc)
+
+
+class BrowserPool:
+    """Warm browser contexts reused across calls that share a headless mode, state file and locale.
+
+    Each ``acquire`` hands out an idle context (or creates one) together with a fresh page. On a
+    clean exit the page is closed and the context goes back to the pool, unless it has served
+    ``max_uses`` calls or ``size`` contexts are already idle for its key. A context whose block
+    raised is closed rather than reused.
+    """
+
+    def __init__(self, size: int = POOL_SIZE, max_uses: int = MAX_USES_PER_INSTANCE) -> None:
+        self.size = size
+        self.max_uses = max_uses
+        self._idle: dict[tuple[bool, Path, str], asyncio.Queue[_PooledContext]] = {}
+        self._closed = False
+
+    def _queue(self, key: tuple[bool, Path, str]) -> asyncio.Queue[_PooledContext]:
+        queue = self._idle.get(key)
+        if queue is None:
+            queue = self._idle[key] = asyncio.Queue(maxsize=max(self.size, 1))
+        return queue
+
+    async def _checkout(self, headless: bool, state_file_path: Path, locale: str) -> _PooledContext:
+        queue = self._queue((headless, state_file_path, locale))
+        while not queue.empty():
+            entry = queue.get_nowait()
+            if entry.browser.is_connected():
+                return entry
+            LOGGER.info("Dropping a pooled context whose browser has disconnected.")
+        playwright = await get_shared_playwright()
+        browser = await get_shared_browser(headless)
+        async with _lock_for(state_file_path):
+            context, saved_state = await create_browser_context(playwright, browser, state_file_path, locale)
+        return _PooledContext(browser, context, saved_state)
+
+    async def _release(self, key: tuple[bool, Path, str], entry: _PooledContext, reusable: bool) -> None:
+        queue = self._idle.get(key)
+        if (
+            reusable
+            and not self._closed
+            and self.size > 0
+            and entry.uses < self.max_uses
+            and entry.browser.is_connected()
+            and queue is not None
+            and not queue.full()
+        ):
+            queue.put_nowait(entry)
+        else:
+            await _close_context(entry.context)
+
+    @asynccontextmanager
+    async def acquire(
+        self, headless: bool, state_file: str, locale: str
+    ) -> AsyncIterator[tuple[BrowserContext, Page, dict[str, Any], Path]]:
+        """Yield ``(context, page, saved_state, state_file_path)`` like ``prepare_context_page``.
+
+        The page is closed on exit; the context must not be closed by the caller.
+        """
+        state_file_path = Path(state_file)
+        key = (headless, state_file_path, locale)
+        entry = await self._checkout(headless, state_file_path, locale)
+        entry.uses += 1
+        reusable = False
+        try:
+            page = await entry.context.new_page()
+            yield entry.context, page, entry.saved_state, state_file_path
+            try:
+                await page.close()
+                reusable = True
+            except PlaywrightError as exc:
+                LOGGER.debug("Discarding a pooled context after a failed page close: %s", exc)
+        finally:
+            await self._release(key, entry, reusable)
+
+    async def close(self) -> None:
+        """Close every idle context; contexts still in use are closed when they are released."""
+        self._closed = True
+        queues = list(self._idle.values())
+        self._idle.clear()
+        contexts = [queue.get_nowait().context for queue in queues for _ in range(queue.qsize())]
+        _ = await asyncio.gather(*(_close_context(context) for context in contexts))
+
+
+def get_browser_pool() -> BrowserPool:
+    """Return the ``BrowserPool`` for the running event loop, creating it on first use."""
+    global _POOL
+    _claim_running_loop()
+    if _POOL is None:
+        _POOL = BrowserPool()
+    return _POOL
+
+
 async def persist_state(
     context: BrowserContext,
     state_file_path: Path,
     saved_state: dict[str, Any],
 ) -> None:
-    """Persist storage state and fingerprint metadata unless saving is disabled."""
+    """Persist storage state and fingerprint metadata, skipping files whose content is unchanged."""
 
-    _ = await context.storage_state(path=str(state_file_path))
     fingerprint_file = state_file_path.with_suffix(FINGERPRINT_SUFFIX)
-    with open(fingerprint_file, "w", encoding="utf-8") as file:
-        json.dump(saved_state, file, indent=2)
+    # The storage-state RPC and the fingerprint write are independent, so they run concurrently.
+    storage_state, _ = await asyncio.gather(
+        context.storage_state(),
+        asyncio.to_thread(_write_if_changed, fingerprint_file, dumps_bytes(saved_state)),
+    )
+    if not await asyncio.to_thread(_write_if_changed, state_file_path, dumps_bytes(storage_state)):
+        LOGGER.debug("Storage state unchanged; not rewriting %s", state_file_path)
 
 
 __all__ = [
+    "BrowserPool",
     "CHROMIUM_LAUNCH_ARGS",
+    "MAX_USES_PER_INSTANCE",
+    "MEDIA_RESOURCE_TYPES",
+    "NON_ESSENTIAL_RESOURCE_TYPES",
+    "POOL_SIZE",
+    "TRACKER_HOSTS",
+    "block_resources",
     "create_browser_context",
+    "get_browser_pool",
+    "get_shared_browser",
+    "get_shared_playwright",
+    "host_is_blocked",
     "launch_browser",
     "persist_state",
     "prepare_context_page",
+    "shutdown_shared_browser",
 ]
@@ -1,14 +1,23 @@
 #!/usr/bin/env python3
-import json
+import os
+import sys
 import asyncio
 import logging
 
 import typer
 
-from .search import google_search, get_google_search_page_html
-from .page_content import fetch_page_markdown
+from .json_utils import dumps, write_json
 
-APP = typer.Typer(help="A Google search CLI tool based on Playwright", pretty_exceptions_short=True)
+# The search and page-content modules pull in Patchright, MarkItDown and their dependencies, so they
+# are imported inside the commands that need them to keep `--help` and argument errors fast.
+
+# Rich tracebacks only help at an interactive terminal; PRETTY_ERRORS overrides the detection.
+PRETTY_ERRORS = os.environ.get("PRETTY_ERRORS", str(sys.stderr.isatty())).lower().startswith("t")
+APP = typer.Typer(
+    help="A Google search CLI tool based on Playwright",
+    pretty_exceptions_enable=PRETTY_ERRORS,
+    pretty_exceptions_short=True,
+)
 
 
 @APP.command("search")
@@ -30,6 +39,9 @@ def google_search_command(
     html_output: str | None = typer.Option(None, help="HTML output file path"),
 ):
     """Run a Google search using Playwright and return JSON results (or the page HTML)."""
+    from .browser_utils import shutdown_shared_browser
+    from .search import get_google_search_page_html, google_search
+
     options = {
         "timeout": timeout,
         "state_file": state_file,
@@ -48,22 +60,23 @@ def google_search_command(
                     output_path=html_output,
                 )
                 if "error" in html_result:
-                    typer.echo(json.dumps(html_result, indent=2))
+                    typer.echo(dumps(html_result))
                 else:
                     if save_html and html_result.get("savedPath"):
                         typer.echo(f"HTML has been saved to file: {html_result['savedPath']}")
 
+                    html = html_result.get("html") or ""
+                    html_length = len(html)
                     output_result = {
                         "query": html_result.get("query"),
                         "url": html_result.get("url"),
                         "originalHtmlLength": html_result.get("originalHtmlLength"),
-                        "cleanedHtmlLength": len(html_result.get("html", "")),
+                        "cleanedHtmlLength": html_length,
                         "savedPath": html_result.get("savedPath"),
                         "screenshotPath": html_result.get("screenshotPath"),
-                        "htmlPreview": html_result.get("html", "")[:500]
-                        + ("..." if len(html_result.get("html", "")) > 500 else ""),
+                        "htmlPreview": html[:500] + ("..." if html_length > 500 else ""),
                     }
-                    typer.echo(json.dumps(output_result, indent=2, ensure_ascii=False))
+                    typer.echo(dumps(output_result))
             else:
                 # Call google_search with explicit parameters to avoid ambiguity.
                 # Pass a literal locale string to avoid type errors from dict lookups.
@@ -76,15 +89,18 @@ def google_search_command(
                     locale="en-US",
                     headless=headless,
                 )
-                typer.echo(json.dumps(results, indent=2, ensure_ascii=False))
+                # Stream the results to stdout instead of building one large string first.
+                sys.stdout.flush()
+                write_json(results, sys.stdout.buffer)
+                _ = sys.stdout.buffer.write(b"\n")
+                sys.stdout.buffer.flush()
         except Exception as e:
             typer.echo(f"Error: {e}", err=True)
             raise typer.Exit(code=1)
+        finally:
+            await shutdown_shared_browser()
 
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    loop.run_until_complete(run())
-    loop.close()
+    asyncio.run(run())
 
 
 @APP.command("fetch-markdown")
@@ -96,6 +112,7 @@ def fetch_markdown_command(
     wait_seconds: float = typer.Option(5, "-w", "--wait", help="Seconds to wait before retrieving page content"),
 ):
     """Render a web page using Playwright and output its Markdown content."""
+    from .page_content import fetch_page_markdown
 
     try:
         markdown = fetch_page_markdown(url=url, timeout=timeout, headless=headless, wait_seconds=wait_seconds)
@@ -0,0 +1,88 @@
+"""JSON serialization helpers backed by ``orjson`` with a stdlib fallback."""
+
+from __future__ import annotations
+
+import json
+from typing import Any, BinaryIO
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is a declared dependency
+    orjson = None
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serialize ``obj`` to UTF-8 encoded, two-space indented JSON.
+
+    >>> dumps_bytes({"query": "café", "results": []})
+    b'{\\n  "query": "caf\\xc3\\xa9",\\n  "results": []\\n}'
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def dumps(obj: Any) -> str:
+    """Serialize ``obj`` to a two-space indented JSON string without escaping non-ASCII text.
+
+    >>> print(dumps({"query": "café"}))
+    {
+      "query": "café"
+    }
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def loads(data: bytes | str) -> Any:
+    """Deserialize a JSON document from ``bytes`` or ``str``.
+
+    >>> loads(b'{"deviceName": "Desktop Chrome"}')
+    {'deviceName': 'Desktop Chrome'}
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _indented(data: bytes, depth: int) -> bytes:
+    # JSON strings never contain raw newlines, so every newline in ``data`` starts a new line of structure.
+    return data.replace(b"\n", b"\n" + b"  " * depth)
+
+
+def write_json(obj: Any, stream: BinaryIO) -> None:
+    """Write ``obj`` to ``stream`` as JSON, serializing list items of a top-level dict one at a time.
+
+    The output is byte-for-byte identical to ``dumps_bytes(obj)``, but the full document is never
+    materialized in memory, which matters for large result lists.
+
+    >>> from io import BytesIO
+    >>> payload = {"query": "q", "results": [{"title": "a"}, {"title": "b"}]}
+    >>> buffer = BytesIO()
+    >>> write_json(payload, buffer)
+    >>> buffer.getvalue() == dumps_bytes(payload)
+    True
+    """
+    if not isinstance(obj, dict) or not obj:
+        _ = stream.write(dumps_bytes(obj))
+        return
+
+    write = stream.write
+    _ = write(b"{")
+    for index, (key, value) in enumerate(obj.items()):
+        _ = write(b",\n  " if index else b"\n  ")
+        _ = write(dumps_bytes(str(key)))
+        _ = write(b": ")
+        if isinstance(value, list) and value:
+            _ = write(b"[")
+            for item_index, item in enumerate(value):
+                _ = write(b",\n    " if item_index else b"\n    ")
+                _ = write(_indented(dumps_bytes(item), 2))
+            _ = write(b"\n  ]")
+        else:
+            _ = write(_indented(dumps_bytes(value), 1))
+    _ = write(b"\n}")
+
+
+__all__ = ["dumps", "dumps_bytes", "loads", "write_json"]
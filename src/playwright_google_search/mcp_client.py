@@ -2,27 +2,23 @@
 
 import json
 import asyncio
-from collections.abc import Awaitable
-from typing import TypeVar
+from collections.abc import Coroutine
+from typing import Any, TypeVar
 
 import typer
 from fastmcp import Client
 
+from .cli import PRETTY_ERRORS
+from .json_utils import dumps
 from .mcp_server import MCP as MCP_APP
 
 CLIENT = Client(MCP_APP)
-APP = typer.Typer(pretty_exceptions_short=True)
+APP = typer.Typer(pretty_exceptions_enable=PRETTY_ERRORS, pretty_exceptions_short=True)
 T = TypeVar("T")
 
 
-def run_sync(coro: Awaitable[T]) -> T:
-    running_loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(running_loop)
-
-    try:
-        return running_loop.run_until_complete(coro)
-    finally:
-        running_loop.close()
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    return asyncio.run(coro)
 
 
 @APP.command()
@@ -31,7 +27,7 @@ def search(query: str):
         async with CLIENT:
             result = await CLIENT.call_tool("search", arguments={"query": query})
             if result.structured_content is not None:
-                print(json.dumps(json.loads(result.structured_content["result"]), indent=2, ensure_ascii=False))
+                print(dumps(json.loads(result.structured_content["result"])))
             else:
                 print("Got an empty response")
                 raise typer.Exit(1)
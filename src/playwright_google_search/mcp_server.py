@@ -1,13 +1,26 @@
 import os
-import json
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 from fastmcp import FastMCP
 
 from .search import google_search
 from .page_content import fetch_page_markdown_async
+from .browser_utils import shutdown_shared_browser
+from .json_utils import dumps
 
-MCP = FastMCP("Google Search 🚀")
+
+@asynccontextmanager
+async def _lifespan(_server: FastMCP) -> AsyncIterator[None]:
+    """Keep the shared browser alive for the server's lifetime and close it on shutdown."""
+    try:
+        yield
+    finally:
+        await shutdown_shared_browser()
+
+
+MCP = FastMCP("Google Search 🚀", lifespan=_lifespan)
 HEADLESS = os.environ.get("HEADLESS", "false").lower().startswith("t")
 
 logging.basicConfig(
@@ -52,7 +65,7 @@ async def search(query: str, limit: int = 10, timeout: int = 60000, headless: No
         # Use the environment variable or the default if not explicitly specified
         headless = HEADLESS
     results = await google_search(query=query, limit=limit, timeout=timeout, headless=headless)
-    return json.dumps(results, indent=2, ensure_ascii=False)
+    return dumps(results)
 
 
 @MCP.tool
@@ -61,6 +74,7 @@ async def fetch_markdown(
     timeout: int = 10000,
     max_n_chars: int = 250_000,
     headless: None | bool = None,
+    wait_seconds: float = 0,
 ) -> str:
     """Open the given URL in Chromium and return the page rendered as Markdown.
 
@@ -77,6 +91,8 @@ async def fetch_markdown(
         headless: Whether to run the browser in headless mode. If None, uses the
             HEADLESS environment variable or defaults to False. Headless mode may
             trigger bot detection on some sites.
+        wait_seconds: Extra seconds to wait after the page loads, for content that
+            scripts render late. Defaults to 0.
 
     Returns:
         The page content rendered as Markdown text. If max_n_chars is exceeded,
@@ -88,7 +104,9 @@ async def fetch_markdown(
     if headless is None:
         # Use the environment variable or the default if not explicitly specified
         headless = HEADLESS
-    markdown_content = await fetch_page_markdown_async(url=url, timeout=timeout, headless=headless)
+    markdown_content = await fetch_page_markdown_async(
+        url=url, timeout=timeout, headless=headless, wait_seconds=wait_seconds
+    )
     if max_n_chars > 0 and len(markdown_content) > max_n_chars:
         markdown_content = markdown_content[:max_n_chars] + "\n\n... (truncated)"
     return markdown_content
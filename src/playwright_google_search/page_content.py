@@ -3,22 +3,34 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 from io import BytesIO
 from typing import Literal
 
-from markitdown import MarkItDown, StreamInfo
+from markitdown import PRIORITY_GENERIC_FILE_FORMAT, MarkItDown, StreamInfo
 from patchright.async_api import (
     Page,
     Error as PlaywrightError,
     TimeoutError as PlaywrightTimeoutError,
-    async_playwright,
 )
 
-from .browser_utils import persist_state, launch_browser, prepare_context_page
+from .browser_utils import (
+    TRACKER_HOSTS,
+    block_resources,
+    get_shared_browser,
+    get_shared_playwright,
+    persist_state,
+    prepare_context_page,
+    shutdown_shared_browser,
+)
 
 LOGGER = logging.getLogger(__name__)
 
+# Upper bound on waiting for the ``load`` event after ``domcontentloaded``, so scripts that render the
+# content get a chance to run without a slow asset holding up the whole fetch.
+LOAD_STATE_TIMEOUT_MS = 5000
+
 TURNSTILE_URL_PATTERNS = [
     "challenges.cloudflare.com",
     "cf-chl",
@@ -29,6 +41,29 @@ TURNSTILE_SELECTORS = [
     "iframe[src*='turnstile']",
     "input[name='cf-turnstile-response']",
 ]
+TURNSTILE_MARKUP_MARKERS = [
+    "cf-turnstile",
+    "challenges.cloudflare.com/turnstile",
+]
+# Checks the selectors and markup markers in the page, so the document is not serialized to Python.
+_HAS_TURNSTILE_JS = """
+([selectors, markers]) => {
+    if (selectors.some((selector) => document.querySelector(selector))) { return true; }
+    const html = document.documentElement ? document.documentElement.outerHTML : '';
+    return markers.some((marker) => html.includes(marker));
+}
+"""
+# Returns the <body> markup without nodes that never reach the Markdown output, or null when the
+# document has no body. MarkItDown's generic HTML converter only reads <body>, so this is lossless for
+# it; URLs claimed by a site-specific converter get the full document (see `_has_site_converter`).
+_PRUNED_BODY_JS = """
+() => {
+    if (!document.body) { return null; }
+    const body = document.body.cloneNode(true);
+    body.querySelectorAll('script, style, noscript, template, link[rel="stylesheet"]').forEach((n) => n.remove());
+    return body.outerHTML;
+}
+"""
 
 
 class TurnstileDetectedError(RuntimeError):
@@ -39,12 +74,7 @@ async def _page_has_turnstile(page: Page) -> bool:
     if any(pattern in page.url for pattern in TURNSTILE_URL_PATTERNS):
         return True
 
-    for selector in TURNSTILE_SELECTORS:
-        if await page.query_selector(selector):
-            return True
-
-    content = await page.content()
-    return "cf-turnstile" in content or "challenges.cloudflare.com/turnstile" in content
+    return bool(await page.evaluate(_HAS_TURNSTILE_JS, [TURNSTILE_SELECTORS, TURNSTILE_MARKUP_MARKERS]))
 
 
 async def _wait_for_turnstile_clear(page: Page, timeout: int) -> None:
@@ -86,7 +116,7 @@ async def _render_page_html(
     url: str,
     timeout: int,
     headless: bool = False,
-    wait_until: Literal["commit", "domcontentloaded", "load", "networkidle"] | None = "networkidle",
+    wait_until: Literal["commit", "domcontentloaded", "load", "networkidle"] | None = "domcontentloaded",
     *,
     # Using .placeholder because we do not use nor save a state file by default
     state_file: str = "/tmp/browser-state.json.placeholder",
@@ -94,47 +124,97 @@ async def _render_page_html(
     # Do not save state by default (saving the state somehow triggers Cloudflare turnstile in some cases)
     no_save_state: bool = True,
     wait_seconds: float = 0,
+    block_non_essential: bool = True,
+    full_content: bool = False,
 ) -> str:
-    """Render the page at ``url`` in Chromium and return its HTML content."""
+    """Render the page at ``url`` in Chromium and return its HTML content.
 
-    async with async_playwright() as playwright:
-        browser = await launch_browser(playwright, headless=headless)
+    Images, media, fonts, stylesheets and known tracker hosts are blocked unless
+    ``block_non_essential`` is False; none of them affect the Markdown output.
+    By default only the pruned ``<body>`` markup is returned, which keeps the
+    payload small; set ``full_content`` to get the whole serialized document.
+    """
 
-        try:
-            (
-                context,
-                page,
-                saved_state,
-                state_file_path,
-            ) = await prepare_context_page(playwright, browser, state_file, locale)
+    playwright = await get_shared_playwright()
+    browser = await get_shared_browser(headless)
+    context = None
+    try:
+        (
+            context,
+            page,
+            saved_state,
+            state_file_path,
+        ) = await prepare_context_page(playwright, browser, state_file, locale)
+        if block_non_essential:
+            await block_resources(page, blocked_hosts=TRACKER_HOSTS)
 
+        try:
+            _ = await page.goto(url, wait_until=wait_until, timeout=timeout)
+        except PlaywrightTimeoutError:
+            LOGGER.warning("Timed out while loading page. Attempting to parse the result anyway: %s", url)
+        else:
             try:
-                _ = await page.goto(url, wait_until=wait_until, timeout=timeout)
+                await page.wait_for_load_state("load", timeout=min(timeout, LOAD_STATE_TIMEOUT_MS))
             except PlaywrightTimeoutError:
-                LOGGER.warning("Timed out while loading page. Attempting to parse the result anyway: %s", url)
+                LOGGER.debug("The load event did not fire in time; continuing with the current DOM: %s", url)
 
-            await _handle_turnstile_if_present(page, headless=headless, timeout=timeout)
+        await _handle_turnstile_if_present(page, headless=headless, timeout=timeout)
 
-            if no_save_state is False:
-                await persist_state(context, state_file_path, saved_state)
+        if no_save_state is False:
+            await persist_state(context, state_file_path, saved_state)
 
-            if wait_seconds > 0:
-                await asyncio.sleep(wait_seconds)
+        if wait_seconds > 0:
+            await asyncio.sleep(wait_seconds)
 
-            return await page.content()
-        except TurnstileDetectedError:
-            raise
-        finally:
-            await browser.close()
+        if not full_content:
+            body_html = await page.evaluate(_PRUNED_BODY_JS)
+            if body_html is not None:
+                return body_html
+        return await page.content()
+    except TurnstileDetectedError:
+        raise
+    finally:
+        # Only the context is ours; the shared browser is reused by later calls.
+        if context:
+            await context.close()
+
+
+@functools.lru_cache(maxsize=1)
+def _converter() -> MarkItDown:
+    # Construction registers every converter and loads the Magika model; conversions only read this state.
+    return MarkItDown()
+
+
+def _has_site_converter(url: str) -> bool:
+    """Return whether a site-specific MarkItDown converter (YouTube, Wikipedia, Bing, ...) claims ``url``.
+
+    Those converters read ``<title>``, ``<meta>`` tags and inline scripts, so they need the whole
+    document rather than the pruned body.
+    """
+    stream_info = StreamInfo(url=url, extension=".html", charset="utf-8")
+    # MarkItDown exposes no public registry; site converters are the ones registered ahead of the generic ones.
+    return any(
+        registration.priority < PRIORITY_GENERIC_FILE_FORMAT
+        and registration.converter.accepts(BytesIO(b""), stream_info)
+        for registration in _converter()._converters
+    )
+
+
+def convert_html_bytes_to_markdown(html_bytes: bytes, url: str) -> str:
+    """Convert UTF-8 encoded HTML into Markdown text without re-encoding it.
+
+    ``BytesIO`` shares the buffer of an immutable ``bytes`` object until it is
+    written to, so wrapping ``html_bytes`` does not copy the document.
+    """
+    stream = BytesIO(html_bytes)
+    stream_info = StreamInfo(url=url, extension=".html", charset="utf-8")
+    markdown_doc = _converter().convert_stream(stream, stream_info=stream_info)
+    return markdown_doc.text_content
 
 
 def convert_html_to_markdown(html: str, url: str) -> str:
     """Convert HTML and metadata returned by Playwright into Markdown text."""
-    converter = MarkItDown()
-    stream = BytesIO(html.encode("utf-8"))
-    stream_info = StreamInfo(url=url, extension=".html")
-    markdown_doc = converter.convert_stream(stream, stream_info=stream_info)
-    return markdown_doc.text_content
+    return convert_html_bytes_to_markdown(html.encode("utf-8"), url)
 
 
 async def fetch_page_markdown_async(
@@ -147,9 +227,19 @@ async def fetch_page_markdown_async(
     wrapper (or the CLI) when you want a conservative default wait time.
     """
 
+    loop = asyncio.get_running_loop()
+    # The first lookup builds the converter, which loads models; keep that off the event loop too.
+    full_content = await loop.run_in_executor(None, _has_site_converter, url)
     try:
+        # A visible browser may need a person to solve a Turnstile challenge, which is unusable without
+        # its stylesheets, images and fonts, so only headless fetches block them.
         html = await _render_page_html(
-            url=url, timeout=timeout, headless=headless, wait_until="networkidle", wait_seconds=wait_seconds
+            url=url,
+            timeout=timeout,
+            headless=headless,
+            wait_seconds=wait_seconds,
+            block_non_essential=headless,
+            full_content=full_content,
         )
     except TurnstileDetectedError as exc:
         if not headless:
@@ -159,13 +249,19 @@ async def fetch_page_markdown_async(
             "Cloudflare Turnstile detected in headless mode. Retrying in headed mode for manual verification."
         )
         html = await _render_page_html(
-            url=url, timeout=timeout, headless=False, wait_until="networkidle", wait_seconds=wait_seconds
+            url=url,
+            timeout=timeout,
+            headless=False,
+            wait_seconds=wait_seconds,
+            block_non_essential=False,
+            full_content=full_content,
         )
     except PlaywrightError as exc:
         LOGGER.error(exc)
         raise RuntimeError(f"Failed to load page: {url}") from exc
 
-    return convert_html_to_markdown(html=html, url=url)
+    # The conversion is CPU-bound; keep it off the event loop so concurrent fetches are not stalled.
+    return await loop.run_in_executor(None, convert_html_to_markdown, html, url)
 
 
 def fetch_page_markdown(url: str, timeout: int = 20000, headless: bool = False, wait_seconds: float = 5) -> str:
@@ -177,11 +273,13 @@ def fetch_page_markdown(url: str, timeout: int = 20000, headless: bool = False,
     to avoid surprising library consumers with an implicit sleep.
     """
 
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        return loop.run_until_complete(
-            fetch_page_markdown_async(url=url, timeout=timeout, headless=headless, wait_seconds=wait_seconds)
-        )
-    finally:
-        loop.close()
+    async def _fetch() -> str:
+        try:
+            return await fetch_page_markdown_async(
+                url=url, timeout=timeout, headless=headless, wait_seconds=wait_seconds
+            )
+        finally:
+            # The shared browser is bound to this event loop, which asyncio.run closes on return.
+            await shutdown_shared_browser()
+
+    return asyncio.run(_fetch())
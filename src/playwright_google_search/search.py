@@ -1,15 +1,22 @@
+import os
 import re
+import copy
+import time
 import random
 import asyncio
 import logging
+import weakref
 from pathlib import Path
 from datetime import datetime
+from types import MappingProxyType
 from typing import Any
+from collections.abc import Coroutine
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
-from bs4 import BeautifulSoup
-from patchright.async_api import Page, Error as PlaywrightError, async_playwright
+from patchright.async_api import Page, Error as PlaywrightError
+from selectolax.lexbor import LexborHTMLParser
 
-from .browser_utils import persist_state, launch_browser, prepare_context_page
+from .browser_utils import MEDIA_RESOURCE_TYPES, block_resources, get_browser_pool, persist_state
 
 # --- Logger Setup ---
 log_dir = Path.home() / ".playwright-google-search"
@@ -38,6 +45,8 @@ SORRY_PATTERNS = [
     "captcha",
     "unusual traffic",
 ]
+# One compiled scan instead of a Python loop over SORRY_PATTERNS on every navigation.
+_SORRY_RE = re.compile("|".join(re.escape(pattern) for pattern in SORRY_PATTERNS))
 GOOGLE_DOMAINS = [
     "https://www.google.com",
     "https://www.google.co.uk",
@@ -60,10 +69,26 @@ SEARCH_INPUT_SELECTORS = [
     "input[aria-label='Search']",
     "textarea",
 ]
+# Bounds, in milliseconds, for the per-keystroke delay drawn once per typed query.
+TYPING_DELAY_RANGE_MS = (5, 15)
+# Selector lists joined into one CSS selector group, so a single DOM query matches any of them.
+SEARCH_INPUT_UNION = ", ".join(SEARCH_INPUT_SELECTORS)
+SEARCH_RESULT_UNION = ", ".join(SEARCH_RESULT_SELECTORS)
+# Returns the first element matching the selectors in priority order. A plain selector group would
+# return the first match in document order instead, letting the catch-all `textarea` win.
+_FIRST_MATCH_JS = """
+(selectors) => {
+    for (const selector of selectors) {
+        const el = document.querySelector(selector);
+        if (el) { return el; }
+    }
+    return null;
+}
+"""
 
 
 async def detect_recaptcha(page: Page, headless_mode: bool, timeout: int, stage_desc: str):
-    if any(pattern in page.url for pattern in SORRY_PATTERNS):
+    if _SORRY_RE.search(page.url) is not None:
         if headless_mode:
             raise PlaywrightError(f"Human verification page detected after {stage_desc} while in headless mode...")
         LOGGER.warning(
@@ -71,7 +96,7 @@ async def detect_recaptcha(page: Page, headless_mode: bool, timeout: int, stage_
         )
         # Wait for the user to complete verification and be redirected back to the search page
         await page.wait_for_url(
-            url=lambda url: all(pattern not in url for pattern in SORRY_PATTERNS),
+            url=lambda url: _SORRY_RE.search(url) is None,
             timeout=timeout * 2,
         )
         LOGGER.info("Human verification complete, continuing search...")
@@ -109,8 +134,9 @@ async def _navigate_and_search(
     Notes:
         - The function uses a small set of selectors to locate the search input and result
             containers; changes in Google's DOM may require selector updates.
-        - The function types the query with a small randomized delay between keystrokes and
-            waits for network idle when navigating to reduce detection.
+        - The function types the query with a small randomized delay between keystrokes to
+            reduce detection. Navigations only wait for DOMContentLoaded followed by the
+            search input or results selectors, since Google's background requests never settle.
     """
 
     # Decide the Google domain to use
@@ -124,34 +150,38 @@ async def _navigate_and_search(
     LOGGER.info("Navigated to %s", page.url)
 
     # Detect ReCAPTCHA
-    if any(pattern in page.url for pattern in SORRY_PATTERNS):
+    if _SORRY_RE.search(page.url) is not None:
         await detect_recaptcha(page, headless_mode, timeout, "initial page load")
 
-    # Locate the search box
-    search_input = None
-    for selector in SEARCH_INPUT_SELECTORS:
-        search_input = await page.query_selector(selector)
-        if search_input:
-            break
+    # The DOM is parsed but scripts may still be attaching the search box; wait for it directly
+    # instead of for the network to go idle.
+    try:
+        _ = await page.wait_for_selector(SEARCH_INPUT_UNION, timeout=timeout)
+    except PlaywrightError as exc:
+        raise PlaywrightError("Could not find search box.") from exc
+
+    # Locate the search box in a single round trip, honoring the selector priority
+    search_input = (await page.evaluate_handle(_FIRST_MATCH_JS, SEARCH_INPUT_SELECTORS)).as_element()
 
     if not search_input:
         raise PlaywrightError("Could not find search box.")
 
     # Type in the query
     await search_input.click()
-    await page.keyboard.type(query, delay=random.randint(10, 30))
+    # One delay per query: Playwright applies the scalar to every keystroke.
+    await page.keyboard.type(query, delay=random.randint(*TYPING_DELAY_RANGE_MS))
     await asyncio.sleep(random.randint(100, 300) / 1000)
     async with page.expect_navigation(wait_until="domcontentloaded", timeout=timeout):
         await page.keyboard.press("Enter")
 
     # Detect ReCAPTCHA
-    if any(pattern in page.url for pattern in SORRY_PATTERNS):
+    if _SORRY_RE.search(page.url) is not None:
         await detect_recaptcha(page, headless_mode, timeout, "clicking search button")
 
     # Wait for any of the known results containers to appear, rather than gating on
     # network idle (Google keeps long-lived connections open that never settle).
     try:
-        _ = await page.wait_for_selector(", ".join(SEARCH_RESULT_SELECTORS), timeout=timeout)
+        _ = await page.wait_for_selector(SEARCH_RESULT_UNION, timeout=timeout)
     except PlaywrightError as exc:
         raise PlaywrightError("Could not find search results element.") from exc
 
@@ -186,28 +216,107 @@ async def _go_to_next_page(page: Page, timeout: int, headless_mode: bool) -> boo
     async with page.expect_navigation(wait_until="domcontentloaded", timeout=timeout):
         await next_link.click()
 
-    if any(pattern in page.url for pattern in SORRY_PATTERNS):
+    if _SORRY_RE.search(page.url) is not None:
         await detect_recaptcha(page, headless_mode, timeout, "flipping to next page")
 
     try:
-        _ = await page.wait_for_selector(", ".join(SEARCH_RESULT_SELECTORS), timeout=timeout)
+        _ = await page.wait_for_selector(SEARCH_RESULT_UNION, timeout=timeout)
     except PlaywrightError as exc:
         raise PlaywrightError("Could not find search results element after page flip.") from exc
     return True
 
 
+TRACKING_QUERY_PARAMS = frozenset({"gclid", "fbclid", "ref"})
+
+
+def _canonicalize_url(url: str) -> str:
+    """Return a dedup key for ``url`` that ignores fragments, tracking parameters and trailing slashes.
+
+    >>> _canonicalize_url("https://Example.com/docs/?utm_source=google&id=3#intro")
+    'https://example.com/docs?id=3'
+    >>> _canonicalize_url("https://example.com/")
+    'https://example.com'
+    """
+    parts = urlsplit(url)
+    query = [
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not name.startswith("utm_") and name not in TRACKING_QUERY_PARAMS
+    ]
+    return urlunsplit(
+        (parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip("/"), urlencode(query, doseq=True), "")
+    )
+
+
+# Result container selectors, ranked: rows from earlier sets come first.
+RESULT_SELECTOR_SETS = tuple(
+    MappingProxyType(selectors)
+    for selectors in (
+        {"container": "#search div[data-hveid]", "title": "h3", "snippet": ".VwiC3b"},
+        {"container": "#rso div[data-hveid]", "title": "h3", "snippet": "[data-sncf='1']"},
+        {"container": ".g", "title": "h3", "snippet": "div[style*='webkit-line-clamp']"},
+        {"container": "div[jscontroller][data-hveid]", "title": "h3", "snippet": "div[role='text']"},
+    )
+)
+# Plain-dict copy for `page.evaluate`, which only serializes real dicts.
+_SELECTOR_SETS_ARG = tuple(dict(selectors) for selectors in RESULT_SELECTOR_SETS)
+# Set order to try for each "winning" set index: the winner first, the rest in rank order.
+_SELECTOR_SET_ORDERS = tuple(
+    (winner, *(index for index in range(len(RESULT_SELECTOR_SETS)) if index != winner))
+    for winner in range(len(RESULT_SELECTOR_SETS))
+)
+# Index of the selector set that last supplied the top result and filled the page on its own,
+# per results-page host.
+_DOMAIN_WINNING_SET: dict[str, int] = {}
+
+# Collects ``{title, link, snippet}`` rows from the selector sets in ``order``, skipping rows without
+# a title or an http(s) link and repeated hrefs. Stops after a whole set once ``minRows`` rows are
+# collected. ``winner`` is the index of the set that supplied the first row if that set alone supplied
+# ``minRows`` rows, or -1 otherwise, so a set that only matches a stray page never gets promoted.
+_EXTRACT_ROWS_JS = """
+({ selectorSets, order, minRows }) => {
+    const rows = [];
+    const seen = new Set();
+    let winner = -1;
+    let winnerRows = 0;
+    for (const index of order) {
+        if (rows.length >= minRows) { break; }
+        const selectors = selectorSets[index];
+        for (const container of document.querySelectorAll(selectors.container)) {
+            const titleEl = container.querySelector(selectors.title);
+            if (!titleEl) { continue; }
+            const title = titleEl.innerText.trim();
+            if (!title) { continue; }
+            const anchor = titleEl.closest("a");
+            const link = anchor ? anchor.href : "";
+            if (!link.startsWith("http") || seen.has(link)) { continue; }
+            seen.add(link);
+            if (winner < 0) { winner = index; }
+            if (index === winner) { winnerRows += 1; }
+            const snippetEl = container.querySelector(selectors.snippet);
+            rows.push({ title, link, snippet: snippetEl ? snippetEl.innerText.trim() : "" });
+        }
+    }
+    return { rows, winner: winnerRows >= minRows ? winner : -1 };
+}
+"""
+
+
 async def _extract_results(page: Page, limit: int, seen_urls: set[str] | None = None) -> list[dict[str, str]]:
     """Extract structured search result entries from a Google search results Page.
 
     This asynchronous helper inspects the provided Playwright Page and attempts to
     locate individual search result containers using a prioritized list of common
     Google result selectors. For each container it extracts a title, a link (URL),
-    and an optional snippet/description. The function deduplicates results by URL
-    and stops once `limit` results have been collected.
+    and an optional snippet/description. The function deduplicates results by their
+    canonical URL (see `_canonicalize_url`) and stops once `limit` results have been
+    collected.
 
     Args:
         page (Page): Playwright Page object representing a loaded Google search results page.
         limit (int): Maximum number of result dictionaries to return.
+        seen_urls (set[str] | None): Canonical URLs already returned (e.g. from earlier
+            result pages). Updated in place with the URLs of the new results.
 
     Returns:
         list[dict[str, str]]: A list of result dictionaries, each containing:
@@ -221,61 +330,122 @@ async def _extract_results(page: Page, limit: int, seen_urls: set[str] | None =
 
     Notes:
         - The function iterates through several selector patterns to maximize compatibility
-            with different Google DOM shapes and ranks results by the order of selector_sets.
+            with different Google DOM shapes and ranks results by the order of
+            RESULT_SELECTOR_SETS, except that the set which last supplied the top result on
+            the same host, and enough rows to fill that page by itself, is tried first.
         - Results without a title, without a valid http/https link, or duplicate URLs are skipped.
-        - This function is I/O bound and must be awaited (it performs many Playwright element calls).
+        - All DOM reads happen in a single `page.evaluate` round trip; only the canonical
+            dedup and the limit are applied in Python.
 
     Example:
         results = await _extract_results(page, 10)
     """
-    selector_sets = [
-        {"container": "#search div[data-hveid]", "title": "h3", "snippet": ".VwiC3b"},
-        {"container": "#rso div[data-hveid]", "title": "h3", "snippet": "[data-sncf='1']"},
-        {"container": ".g", "title": "h3", "snippet": "div[style*='webkit-line-clamp']"},
-        {"container": "div[jscontroller][data-hveid]", "title": "h3", "snippet": "div[role='text']"},
-    ]
-
     results: list[dict[str, str]] = []
     if seen_urls is None:
         seen_urls = set()
 
-    for selectors in selector_sets:
+    # One round trip for the candidate rows; canonical dedup and the limit are applied here because
+    # ``seen_urls`` may already hold URLs from earlier result pages. Asking for ``limit + len(seen_urls)``
+    # rows leaves room for those repeats, so the script can usually stop after the first set.
+    domain = urlsplit(page.url).netloc
+    order = _SELECTOR_SET_ORDERS[_DOMAIN_WINNING_SET.get(domain, 0)]
+    extracted = await page.evaluate(
+        _EXTRACT_ROWS_JS,
+        {"selectorSets": _SELECTOR_SETS_ARG, "order": order, "minRows": limit + len(seen_urls)},
+    )
+    if extracted["winner"] >= 0:
+        _DOMAIN_WINNING_SET[domain] = extracted["winner"]
+    else:
+        # No single set filled the page, so go back to the ranked order next time.
+        _ = _DOMAIN_WINNING_SET.pop(domain, None)
+    # Bound methods are looked up once instead of once per row.
+    append_result = results.append
+    remember_url = seen_urls.add
+    for row in extracted["rows"]:
         if len(results) >= limit:
             break
+        # Dedup on the canonical form so tracking params and fragments don't produce near-duplicates.
+        url_key = _canonicalize_url(row["link"])
+        if url_key in seen_urls:
+            continue
+        append_result(row)
+        remember_url(url_key)
 
-        containers = await page.query_selector_all(selectors["container"])
-        for container in containers:
-            if len(results) >= limit:
-                break
+    return results
 
-            title_el = await container.query_selector(selectors["title"])
-            if not title_el:
-                continue
 
-            title = (await title_el.inner_text()).strip()
-            if not title:
-                continue
+# --- Shared Utilities ---
 
-            # Find the closest ancestor <a> and get its href
-            link = await title_el.evaluate("el => { const a = el.closest('a'); return a ? a.href : '' }")
 
-            if not link or not link.startswith("http") or link in seen_urls:
-                continue
+def _is_human_verification_error(e: Exception) -> bool:
+    return "Human verification" in str(e)
 
-            snippet_el = await container.query_selector(selectors["snippet"])
-            snippet = (await snippet_el.inner_text()).strip() if snippet_el else ""
 
-            results.append({"title": title, "link": link, "snippet": snippet})
-            seen_urls.add(link)
+NON_CONTENT_TAGS = ["script", "style", "noscript", "svg"]
+_NON_CONTENT_SELECTOR = ", ".join(NON_CONTENT_TAGS)
 
-    return results[:limit]
 
+def _clean_html(html: str) -> str:
+    """Return ``html`` with script, style, noscript and svg elements removed.
 
-# --- Shared Utilities ---
+    >>> _clean_html("<div><script>track()</script><p>Result</p><svg><path/></svg></div>")
+    '<html><head></head><body><div><p>Result</p></div></body></html>'
+    """
+    tree = LexborHTMLParser(html)
+    for node in tree.css(_NON_CONTENT_SELECTOR):
+        node.decompose()
+    return tree.html or ""
 
 
-def _is_human_verification_error(e: Exception) -> bool:
-    return "Human verification" in str(e)
+# --- Result Cache ---
+# Successful results are reused for this many seconds; set GSEARCH_CACHE_TTL=0 to disable caching.
+SEARCH_CACHE_TTL = float(os.environ.get("GSEARCH_CACHE_TTL", "3600"))
+SEARCH_CACHE_MAX_ENTRIES = 256
+_SEARCH_CACHE: dict[tuple[str, int, str], tuple[float, dict[str, Any]]] = {}
+
+
+def _search_cache_key(query: str, limit: int, locale: str) -> tuple[str, int, str]:
+    return (query.strip().lower(), limit, locale)
+
+
+def _search_cache_get(key: tuple[str, int, str]) -> dict[str, Any] | None:
+    entry = _SEARCH_CACHE.get(key)
+    if entry is None:
+        return None
+    stored_at, result = entry
+    if time.monotonic() - stored_at >= SEARCH_CACHE_TTL:
+        del _SEARCH_CACHE[key]
+        return None
+    return copy.deepcopy(result)
+
+
+def _search_cache_put(key: tuple[str, int, str], result: dict[str, Any]) -> None:
+    if SEARCH_CACHE_TTL <= 0:
+        return
+    _ = _SEARCH_CACHE.pop(key, None)
+    _SEARCH_CACHE[key] = (time.monotonic(), copy.deepcopy(result))
+    while len(_SEARCH_CACHE) > SEARCH_CACHE_MAX_ENTRIES:
+        # Dicts keep insertion order, so the first key is the oldest entry.
+        del _SEARCH_CACHE[next(iter(_SEARCH_CACHE))]
+
+
+# --- Concurrency Limit ---
+# Bounds how many searches drive a browser at once; Google answers bursts with verification pages.
+SEARCH_MAX_CONCURRENCY = int(os.environ.get("GSEARCH_MAX_CONCURRENCY", "4"))
+if SEARCH_MAX_CONCURRENCY < 1:
+    raise ValueError(f"GSEARCH_MAX_CONCURRENCY must be at least 1, got {SEARCH_MAX_CONCURRENCY}")
+# One semaphore per event loop: a semaphore binds to the first loop that waits on it.
+_SEARCH_SEMAPHORES: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _search_semaphore() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    semaphore = _SEARCH_SEMAPHORES.get(loop)
+    if semaphore is None:
+        semaphore = _SEARCH_SEMAPHORES[loop] = asyncio.Semaphore(SEARCH_MAX_CONCURRENCY)
+    return semaphore
 
 
 # --- Main Functions ---
@@ -287,18 +457,110 @@ async def google_search(
     no_save_state: bool = False,
     locale: str = "en-US",
     headless: bool = True,
+    force_refresh: bool = False,
+    block_non_essential: bool = False,
+    semaphore: asyncio.Semaphore | None = None,
 ) -> dict[str, Any]:
-    async with async_playwright() as p:
-        for _ in range(2):
-            browser = await launch_browser(p, headless)
-            context = None
-            try:
-                (
-                    context,
-                    page,
-                    saved_state,
-                    state_file_path,
-                ) = await prepare_context_page(p, browser, state_file, locale)
+    """Search Google for ``query`` and return up to ``limit`` results.
+
+    Successful results are cached in-process for ``SEARCH_CACHE_TTL`` seconds,
+    keyed on the normalized query, ``limit`` and ``locale``. Pass
+    ``force_refresh=True`` to bypass the cached entry and replace it.
+
+    Pass ``block_non_essential=True`` to skip downloading images, media and
+    fonts; stylesheets still load so result text is read as displayed. It is
+    off by default because request interception disables the HTTP cache and
+    routes every request through Python, so pooled contexts would otherwise
+    re-download Google's scripts on each search.
+
+    At most ``SEARCH_MAX_CONCURRENCY`` uncached searches run at once across the
+    process; pass a ``semaphore`` to apply a different limit to a group of calls.
+
+    Concurrent calls with the same cache key share a single in-flight search
+    instead of each driving the browser.
+    """
+    key = _search_cache_key(query, limit, locale)
+    if not force_refresh:
+        cached = _search_cache_get(key)
+        if cached is not None:
+            LOGGER.info("Returning cached results for %r", query)
+            cached["query"] = query
+            return cached
+
+    task = _INFLIGHT.get(key)
+    if task is None:
+        task = asyncio.create_task(
+            _search_and_cache(
+                key,
+                semaphore or _search_semaphore(),
+                query,
+                limit,
+                timeout,
+                state_file,
+                no_save_state,
+                locale,
+                headless,
+                block_non_essential,
+            )
+        )
+        _INFLIGHT[key] = task
+        task.add_done_callback(lambda done: _forget_inflight(key, done))
+    else:
+        LOGGER.info("Joining the in-flight search for %r", query)
+
+    # Shielded so one caller being cancelled does not cancel the search for the others.
+    result = copy.deepcopy(await asyncio.shield(task))
+    result["query"] = query
+    return result
+
+
+# Searches currently running, keyed like the result cache, so concurrent duplicates can join them.
+_INFLIGHT: dict[tuple[str, int, str], asyncio.Task[dict[str, Any]]] = {}
+
+
+def _forget_inflight(key: tuple[str, int, str], task: asyncio.Task[dict[str, Any]]) -> None:
+    if _INFLIGHT.get(key) is task:
+        del _INFLIGHT[key]
+
+
+async def _search_and_cache(
+    key: tuple[str, int, str],
+    semaphore: asyncio.Semaphore,
+    query: str,
+    limit: int,
+    timeout: int,
+    state_file: str,
+    no_save_state: bool,
+    locale: str,
+    headless: bool,
+    block_non_essential: bool,
+) -> dict[str, Any]:
+    async with semaphore:
+        result = await _google_search_uncached(
+            query, limit, timeout, state_file, no_save_state, locale, headless, block_non_essential
+        )
+    if "error" not in result:
+        _search_cache_put(key, result)
+    return result
+
+
+async def _google_search_uncached(
+    query: str,
+    limit: int,
+    timeout: int,
+    state_file: str,
+    no_save_state: bool,
+    locale: str,
+    headless: bool,
+    block_non_essential: bool = False,
+) -> dict[str, Any]:
+    pool = get_browser_pool()
+    for _ in range(2):
+        try:
+            # Contexts come from a warm pool; one whose block raises is discarded instead of reused.
+            async with pool.acquire(headless, state_file, locale) as (context, page, saved_state, state_file_path):
+                if block_non_essential:
+                    await block_resources(page, resource_types=MEDIA_RESOURCE_TYPES)
 
                 await _navigate_and_search(page, query, timeout, saved_state, headless)
 
@@ -324,25 +586,22 @@ async def google_search(
 
                 return {"query": query, "results": results}
 
-            except PlaywrightError as e:
-                if _is_human_verification_error(e):
-                    if headless:
-                        LOGGER.warning("Human verification detected, restarting in headed mode.")
-                        headless = False
-                        # retry on next loop iteration
-                    else:
-                        break
+        except PlaywrightError as e:
+            if _is_human_verification_error(e):
+                if headless:
+                    LOGGER.warning("Human verification detected, restarting in headed mode.")
+                    headless = False
+                    # retry on next loop iteration
                 else:
-                    LOGGER.error("An error occurred during search: %s", e)
-                    return {"query": query, "results": [], "error": str(e)}
-            finally:
-                if context:
-                    LOGGER.info("Closing the context...")
-                    await context.close()
-                if browser:
-                    LOGGER.info("Closing the browser...")
-                    await browser.close()
-        return {"query": query, "results": [], "error": "Human verification detected; retry in headed mode exhausted."}
+                    break
+            else:
+                LOGGER.error("An error occurred during search: %s", e)
+                return {"query": query, "results": [], "error": str(e)}
+    return {"query": query, "results": [], "error": "Human verification detected; retry in headed mode exhausted."}
+
+
+HTML_FILE_TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+_UNSAFE_FILENAME_CHARS_RE = re.compile(r"[^a-zA-Z0-9]")
 
 
 async def get_google_search_page_html(
@@ -350,6 +609,22 @@ async def get_google_search_page_html(
     options: dict[str, Any],
     save_to_file: bool = False,
     output_path: str | None = None,
+    semaphore: asyncio.Semaphore | None = None,
+) -> dict[str, Any]:
+    """Search Google for ``query`` and return the cleaned HTML of the results page.
+
+    Shares the ``SEARCH_MAX_CONCURRENCY`` limit with ``google_search`` unless a
+    ``semaphore`` is given.
+    """
+    async with semaphore or _search_semaphore():
+        return await _get_google_search_page_html(query, options, save_to_file, output_path)
+
+
+async def _get_google_search_page_html(
+    query: str,
+    options: dict[str, Any],
+    save_to_file: bool,
+    output_path: str | None,
 ) -> dict[str, Any]:
     timeout = options.get("timeout", DEFAULT_TIMEOUT)
     state_file = options.get("state_file", "./browser-state.json")
@@ -357,26 +632,16 @@ async def get_google_search_page_html(
     locale = options.get("locale", "en-US")
     headless = not options.get("no_headless", False)
 
-    async with async_playwright() as p:
-        headless_mode = headless
-        for _ in range(2):
-            browser = await launch_browser(p, headless_mode)
-            context = None
-            try:
-                (
-                    context,
-                    page,
-                    saved_state,
-                    state_file_path,
-                ) = await prepare_context_page(p, browser, state_file, locale)
-
+    pool = get_browser_pool()
+    headless_mode = headless
+    for _ in range(2):
+        try:
+            async with pool.acquire(headless_mode, state_file, locale) as (context, page, saved_state, state_file_path):
                 await _navigate_and_search(page, query, timeout, saved_state, headless_mode)
 
                 full_html = await page.content()
-                soup = BeautifulSoup(full_html, "html.parser")
-                for tag in soup(["script", "style"]):
-                    tag.decompose()
-                html = str(soup)
+                # Parsing a full results page is CPU-bound; keep it off the event loop.
+                html = await asyncio.get_running_loop().run_in_executor(None, _clean_html, full_html)
 
                 result = {
                     "query": query,
@@ -385,46 +650,47 @@ async def get_google_search_page_html(
                     "originalHtmlLength": len(full_html),
                 }
 
+                pending: list[Coroutine[Any, Any, Any]] = []
                 if save_to_file:
                     if not output_path:
                         output_dir = Path("./google-search-html")
                         output_dir.mkdir(exist_ok=True)
-                        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                        sanitized_query = re.sub(r"[^a-zA-Z0-9]", "_", query)[:50]
+                        timestamp = datetime.now().strftime(HTML_FILE_TIMESTAMP_FORMAT)
+                        sanitized_query = _UNSAFE_FILENAME_CHARS_RE.sub("_", query)[:50]
                         output_path = str(output_dir / f"{sanitized_query}-{timestamp}.html")
 
-                    with open(output_path, "w", encoding="utf-8") as f:
-                        _ = f.write(html)
-                    result["savedPath"] = output_path
-
                     screenshot_path = Path(output_path).with_suffix(".png")
-                    _ = await page.screenshot(path=str(screenshot_path), full_page=True)
+                    pending.append(asyncio.to_thread(Path(output_path).write_text, html, encoding="utf-8"))
+                    pending.append(page.screenshot(path=str(screenshot_path), full_page=True))
+                    result["savedPath"] = output_path
                     result["screenshotPath"] = str(screenshot_path)
 
                 if no_save_state is False:
-                    await persist_state(context, state_file_path, saved_state)
-
+                    pending.append(persist_state(context, state_file_path, saved_state))
+
+                # The HTML write, the screenshot and the state persistence are independent, so they overlap.
+                # A task group cancels and awaits the others when one fails, so none outlives the context.
+                try:
+                    async with asyncio.TaskGroup() as group:
+                        for job in pending:
+                            _ = group.create_task(job)
+                except ExceptionGroup as errors:
+                    # Re-raise the first failure so the PlaywrightError handling below still applies.
+                    raise errors.exceptions[0]
                 return result
 
-            except PlaywrightError as e:
-                if _is_human_verification_error(e) and headless_mode:
-                    LOGGER.warning("Human verification detected, restarting in headed mode.")
-                    headless_mode = False
-                    # retry on next loop iteration
-                else:
-                    LOGGER.error("An error occurred while getting HTML: %s", e)
-                    return {"query": query, "html": "", "url": "", "error": str(e)}
-            finally:
-                if context:
-                    LOGGER.info("Closing the context...")
-                    await context.close()
-                if browser:
-                    LOGGER.info("Closing the browser...")
-                    await browser.close()
-
-        return {
-            "query": query,
-            "html": "",
-            "url": "",
-            "error": "Human verification detected; retry in headed mode exhausted.",
-        }
+        except PlaywrightError as e:
+            if _is_human_verification_error(e) and headless_mode:
+                LOGGER.warning("Human verification detected, restarting in headed mode.")
+                headless_mode = False
+                # retry on next loop iteration
+            else:
+                LOGGER.error("An error occurred while getting HTML: %s", e)
+                return {"query": query, "html": "", "url": "", "error": str(e)}
+
+    return {
+        "query": query,
+        "html": "",
+        "url": "",
+        "error": "Human verification detected; retry in headed mode exhausted.",
+    }
@@ -0,0 +1,227 @@
+"""Tests for the browser helpers, using stand-ins for Playwright objects."""
+
+import asyncio
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from playwright_google_search import browser_utils
+from playwright_google_search.browser_utils import BrowserPool
+
+
+class _FakePage:
+    async def close(self) -> None:
+        pass
+
+
+class _FakeContext:
+    def __init__(self) -> None:
+        self.closed = False
+
+    async def new_page(self) -> _FakePage:
+        return _FakePage()
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class _FakeBrowser:
+    def is_connected(self) -> bool:
+        return True
+
+
+@pytest.fixture
+def created_contexts(monkeypatch: pytest.MonkeyPatch) -> list[_FakeContext]:
+    """Make the pool create fake contexts and record each one it creates."""
+    contexts: list[_FakeContext] = []
+    browser = _FakeBrowser()
+
+    async def _fake_playwright() -> None:
+        return None
+
+    async def _fake_browser(headless: bool) -> _FakeBrowser:
+        return browser
+
+    async def _fake_create(playwright: Any, browser: Any, state_file: Path, locale: str) -> tuple[Any, dict]:
+        context = _FakeContext()
+        contexts.append(context)
+        return context, {}
+
+    monkeypatch.setattr(browser_utils, "get_shared_playwright", _fake_playwright)
+    monkeypatch.setattr(browser_utils, "get_shared_browser", _fake_browser)
+    monkeypatch.setattr(browser_utils, "create_browser_context", _fake_create)
+    return contexts
+
+
+def test_browser_pool_reuses_context_until_max_uses(created_contexts: list[_FakeContext]) -> None:
+    async def _run() -> None:
+        pool = BrowserPool(size=1, max_uses=2)
+        for _ in range(3):
+            async with pool.acquire(True, "state.json", "en-US"):
+                pass
+        await pool.close()
+
+    asyncio.run(_run())
+
+    assert len(created_contexts) == 2
+    assert all(context.closed for context in created_contexts)
+
+
+def test_browser_pool_discards_context_after_error(created_contexts: list[_FakeContext]) -> None:
+    async def _run() -> None:
+        pool = BrowserPool(size=1, max_uses=10)
+        with pytest.raises(RuntimeError):
+            async with pool.acquire(True, "state.json", "en-US"):
+                raise RuntimeError("boom")
+        async with pool.acquire(True, "state.json", "en-US"):
+            pass
+
+    asyncio.run(_run())
+
+    assert len(created_contexts) == 2
+    assert created_contexts[0].closed
+    assert not created_contexts[1].closed
+
+
+class _RecordingContext(_FakeContext):
+    async def add_init_script(self, script: str) -> None:
+        pass
+
+
+class _RecordingBrowser(_FakeBrowser):
+    def __init__(self) -> None:
+        self.context_options: list[dict[str, Any]] = []
+
+    async def new_context(self, **options: Any) -> _RecordingContext:
+        self.context_options.append(options)
+        return _RecordingContext()
+
+
+class _FakePlaywright:
+    devices = {"Desktop Chrome": {"user_agent": "test-agent", "viewport": {"width": 1280, "height": 720}}}
+
+
+def test_create_browser_context_restores_saved_fingerprint_and_storage(tmp_path: Path) -> None:
+    state_file = tmp_path / "browser-state.json"
+    _ = state_file.write_text('{"cookies": [], "origins": []}', encoding="utf-8")
+    fingerprint = {
+        "fingerprint": {
+            "deviceName": "Desktop Chrome",
+            "locale": "de-DE",
+            "timezoneId": "Europe/Berlin",
+            "colorScheme": "dark",
+        },
+        "googleDomain": "https://www.google.com",
+    }
+    _ = state_file.with_suffix(browser_utils.FINGERPRINT_SUFFIX).write_bytes(browser_utils.dumps_bytes(fingerprint))
+    browser = _RecordingBrowser()
+
+    _, saved_state = asyncio.run(browser_utils.create_browser_context(_FakePlaywright(), browser, state_file, "en-US"))
+
+    assert saved_state == fingerprint
+    (options,) = browser.context_options
+    assert options["storage_state"] == str(state_file)
+    assert (options["locale"], options["timezone_id"], options["color_scheme"]) == ("de-DE", "Europe/Berlin", "dark")
+    assert options["user_agent"] == "test-agent"
+
+
+def test_get_device_reads_devices_once_per_playwright_instance() -> None:
+    class _CountingPlaywright:
+        def __init__(self, user_agent: str) -> None:
+            self.user_agent = user_agent
+            self.reads = 0
+
+        @property
+        def devices(self) -> dict[str, dict[str, Any]]:
+            self.reads += 1
+            return {"Desktop Chrome": {"user_agent": self.user_agent}}
+
+    first, second = _CountingPlaywright("first"), _CountingPlaywright("second")
+
+    assert browser_utils._get_device(first, "Desktop Chrome") == {"user_agent": "first"}
+    assert browser_utils._get_device(first, "Missing Device") is None
+    assert browser_utils._get_device(second, "Desktop Chrome") == {"user_agent": "second"}
+    assert (first.reads, second.reads) == (1, 1)
+
+
+class _FakeDriver:
+    def __init__(self) -> None:
+        self.chromium = self
+        self.launched: list[_FakeBrowser] = []
+
+    async def launch(self, **options: Any) -> _FakeBrowser:
+        browser = _FakeBrowser()
+        self.launched.append(browser)
+        return browser
+
+
+def test_shared_browser_is_restarted_for_a_new_event_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    drivers: list[_FakeDriver] = []
+
+    class _FakeManager:
+        async def start(self) -> _FakeDriver:
+            drivers.append(_FakeDriver())
+            return drivers[-1]
+
+    monkeypatch.setattr(browser_utils, "async_playwright", _FakeManager)
+    monkeypatch.setattr(browser_utils, "_PW", None)
+    monkeypatch.setattr(browser_utils, "_PW_LOOP", None)
+    monkeypatch.setattr(browser_utils, "_BROWSERS", {})
+    monkeypatch.setattr(browser_utils, "_POOL", None)
+
+    async def _twice() -> tuple[Any, Any]:
+        return await browser_utils.get_shared_browser(True), await browser_utils.get_shared_browser(True)
+
+    first, again = asyncio.run(_twice())
+    (second, _) = asyncio.run(_twice())
+
+    assert first is again
+    assert second is not first
+    assert len(drivers) == 2
+    assert [len(driver.launched) for driver in drivers] == [1, 1]
+
+
+@pytest.fixture
+def persisted_digests(monkeypatch: pytest.MonkeyPatch) -> dict[Path, bytes]:
+    digests: dict[Path, bytes] = {}
+    monkeypatch.setattr(browser_utils, "_PERSISTED_DIGESTS", digests)
+    return digests
+
+
+def test_write_if_changed_skips_unchanged_bytes(tmp_path: Path, persisted_digests: dict[Path, bytes]) -> None:
+    target = tmp_path / "state.fingerprint.json"
+
+    assert browser_utils._write_if_changed(target, b'{"a": 1}')
+    inode = target.stat().st_ino
+    assert not browser_utils._write_if_changed(target, b'{"a": 1}')
+    # An atomic rewrite replaces the file, so an unchanged inode means nothing was written.
+    assert target.stat().st_ino == inode
+    assert browser_utils._write_if_changed(target, b'{"a": 2}')
+    assert target.read_bytes() == b'{"a": 2}'
+
+
+def test_write_if_changed_rewrites_a_deleted_file(tmp_path: Path, persisted_digests: dict[Path, bytes]) -> None:
+    target = tmp_path / "state.fingerprint.json"
+    assert browser_utils._write_if_changed(target, b"{}")
+    target.unlink()
+
+    assert browser_utils._write_if_changed(target, b"{}")
+    assert target.read_bytes() == b"{}"
+
+
+def test_write_atomic_failure_keeps_target_and_removes_temp_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    target = tmp_path / "state.fingerprint.json"
+    _ = target.write_bytes(b"old")
+
+    def _failing_replace(src: str, dst: Path) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(browser_utils.os, "replace", _failing_replace)
+
+    with pytest.raises(OSError, match="disk full"):
+        browser_utils._write_atomic(target, b"new")
+    assert target.read_bytes() == b"old"
+    assert list(tmp_path.iterdir()) == [target]
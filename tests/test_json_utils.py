@@ -0,0 +1,26 @@
+"""Tests for the JSON serialization helpers."""
+
+from io import BytesIO
+
+import pytest
+
+from playwright_google_search.json_utils import dumps_bytes, loads, write_json
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"query": "café", "results": [{"title": "Résumé", "link": "https://example.com", "snippet": ""}]},
+        {"query": "nothing", "results": [], "error": "Human verification detected"},
+        {"query": "nested", "results": [{"title": "a", "tags": ["x", "y"], "meta": {"rank": 1}}], "count": 1},
+        {},
+        [1, 2, 3],
+    ],
+)
+def test_write_json_matches_dumps_bytes(payload: object) -> None:
+    buffer = BytesIO()
+
+    write_json(payload, buffer)
+
+    assert buffer.getvalue() == dumps_bytes(payload)
+    assert loads(buffer.getvalue()) == payload
@@ -1,6 +1,13 @@
 """Tests for HTML to Markdown conversion helpers."""
 
-from playwright_google_search.page_content import convert_html_to_markdown
+import asyncio
+from typing import Any
+
+import pytest
+from markitdown.converters import _youtube_converter
+
+from playwright_google_search import page_content
+from playwright_google_search.page_content import convert_html_bytes_to_markdown, convert_html_to_markdown
 
 
 def test_convert_html_to_markdown_converts_basic_structure() -> None:
@@ -22,3 +29,91 @@ def test_convert_html_to_markdown_converts_basic_structure() -> None:
     assert "Hello" in markdown
     assert "World" in markdown
     assert "[Example Link](https://example.com)" in markdown
+
+
+def test_convert_html_bytes_to_markdown_matches_str_variant() -> None:
+    html = "<html><body><h1>Café</h1><p>Menü</p></body></html>"
+
+    markdown = convert_html_bytes_to_markdown(html.encode("utf-8"), url="https://example.com")
+
+    assert markdown == convert_html_to_markdown(html=html, url="https://example.com")
+    assert "Café" in markdown
+
+
+class _EvaluatingPage:
+    """Stand-in page that only supports ``evaluate``, so a full ``content()`` fetch would fail."""
+
+    url = "https://example.com/"
+
+    def __init__(self, verdict: bool) -> None:
+        self.verdict = verdict
+        self.calls: list[Any] = []
+
+    async def evaluate(self, script: str, arg: Any) -> bool:
+        self.calls.append(arg)
+        return self.verdict
+
+
+def test_page_has_turnstile_checks_markup_in_the_page() -> None:
+    page = _EvaluatingPage(verdict=False)
+
+    assert asyncio.run(page_content._page_has_turnstile(page)) is False
+    assert page.calls == [[page_content.TURNSTILE_SELECTORS, page_content.TURNSTILE_MARKUP_MARKERS]]
+
+
+def test_page_has_turnstile_matches_challenge_url_without_evaluating() -> None:
+    page = _EvaluatingPage(verdict=False)
+    page.url = "https://challenges.cloudflare.com/cdn-cgi/challenge-platform"
+
+    assert asyncio.run(page_content._page_has_turnstile(page)) is True
+    assert page.calls == []
+
+
+YOUTUBE_URL = "https://www.youtube.com/watch?v=abc123"
+YOUTUBE_HTML = """
+<html>
+    <head>
+        <title>Cool Video</title>
+        <meta itemprop="interactionCount" content="12345">
+        <meta name="description" content="A great video">
+    </head>
+    <body><p>Page body text</p></body>
+</html>
+"""
+
+
+def test_fetch_page_markdown_keeps_the_full_document_for_youtube(monkeypatch: pytest.MonkeyPatch) -> None:
+    # The transcript lookup needs the network; the metadata below comes from <head> alone.
+    monkeypatch.setattr(_youtube_converter, "IS_YOUTUBE_TRANSCRIPT_CAPABLE", False)
+    requested: list[bool] = []
+
+    async def _fake_render(url: str, timeout: int, **options: Any) -> str:
+        requested.append(options["full_content"])
+        return YOUTUBE_HTML if options["full_content"] else "<body><p>Page body text</p></body>"
+
+    monkeypatch.setattr(page_content, "_render_page_html", _fake_render)
+
+    markdown = asyncio.run(page_content.fetch_page_markdown_async(YOUTUBE_URL))
+    _ = asyncio.run(page_content.fetch_page_markdown_async("https://example.com/article"))
+
+    assert requested == [True, False]
+    assert "## Cool Video" in markdown
+    assert "- **Views:** 12345" in markdown
+    assert "A great video" in markdown
+
+
+def test_headed_turnstile_retry_loads_every_resource(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[tuple[bool, bool]] = []
+
+    async def _fake_render(url: str, timeout: int, **options: Any) -> str:
+        calls.append((options["headless"], options["block_non_essential"]))
+        if options["headless"]:
+            raise page_content.TurnstileDetectedError("challenge")
+        return "<body><p>Solved</p></body>"
+
+    monkeypatch.setattr(page_content, "_render_page_html", _fake_render)
+
+    markdown = asyncio.run(page_content.fetch_page_markdown_async("https://example.com/", headless=True))
+
+    assert calls == [(True, True), (False, False)]
+    assert "Solved" in markdown
@@ -0,0 +1,199 @@
+"""Tests for the browser-free parts of the Google search helpers."""
+
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from playwright_google_search import search
+
+
+@pytest.fixture
+def fake_search(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Replace the browser-driven search with a stub that records each query it receives."""
+    calls: list[str] = []
+
+    async def _fake_uncached(query: str, limit: int, *args: Any) -> dict[str, Any]:
+        calls.append(query)
+        return {"query": query, "results": [{"title": "t", "link": "https://example.com", "snippet": ""}]}
+
+    monkeypatch.setattr(search, "_google_search_uncached", _fake_uncached)
+    monkeypatch.setattr(search, "_SEARCH_CACHE", {})
+    monkeypatch.setattr(search, "_INFLIGHT", {})
+    return calls
+
+
+def test_google_search_reuses_cached_results(fake_search: list[str]) -> None:
+    first = asyncio.run(search.google_search("OpenAI ", limit=5))
+    first["results"].clear()
+    second = asyncio.run(search.google_search("openai", limit=5))
+
+    assert fake_search == ["OpenAI "]
+    assert second["query"] == "openai"
+    assert len(second["results"]) == 1
+
+
+def test_google_search_force_refresh_bypasses_cache(fake_search: list[str]) -> None:
+    _ = asyncio.run(search.google_search("openai", limit=5))
+    _ = asyncio.run(search.google_search("openai", limit=5, force_refresh=True))
+    _ = asyncio.run(search.google_search("openai", limit=3))
+
+    assert fake_search == ["openai", "openai", "openai"]
+
+
+class _RowsPage:
+    """Minimal stand-in for a Playwright Page whose `evaluate` returns canned result rows."""
+
+    url = "https://www.google.com/search?q=test"
+
+    def __init__(self, rows: list[dict[str, str]], winner: int = 0) -> None:
+        self.rows = rows
+        self.winner = winner
+        self.evaluate_args: list[Any] = []
+
+    async def evaluate(self, expression: str, arg: Any = None) -> dict[str, Any]:
+        self.evaluate_args.append(arg)
+        return {"rows": [dict(row) for row in self.rows], "winner": self.winner}
+
+
+def test_extract_results_dedups_canonical_urls_and_applies_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(search, "_DOMAIN_WINNING_SET", {})
+    page = _RowsPage(
+        [
+            {"title": "A", "link": "https://example.com/a?utm_source=google", "snippet": "first"},
+            {"title": "A again", "link": "https://example.com/a/", "snippet": ""},
+            {"title": "B", "link": "https://example.com/b", "snippet": ""},
+            {"title": "C", "link": "https://example.com/c", "snippet": ""},
+        ]
+    )
+    seen_urls = {"https://example.com/b"}
+
+    results = asyncio.run(search._extract_results(page, 2, seen_urls))
+
+    assert len(page.evaluate_args) == 1
+    assert [result["title"] for result in results] == ["A", "C"]
+    assert seen_urls == {"https://example.com/a", "https://example.com/b", "https://example.com/c"}
+
+
+def test_google_search_joins_identical_in_flight_queries(fake_search: list[str]) -> None:
+    async def _run() -> list[dict[str, Any]]:
+        return await asyncio.gather(search.google_search("openai"), search.google_search("OpenAI"))
+
+    first, second = asyncio.run(_run())
+
+    assert fake_search == ["openai"]
+    assert (first["query"], second["query"]) == ("openai", "OpenAI")
+    assert first["results"] == second["results"]
+    assert first["results"] is not second["results"]
+    assert search._INFLIGHT == {}
+
+
+def test_google_search_semaphore_bounds_concurrent_searches(monkeypatch: pytest.MonkeyPatch) -> None:
+    active = peak = 0
+
+    async def _slow_uncached(query: str, limit: int, *args: Any) -> dict[str, Any]:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return {"query": query, "results": []}
+
+    monkeypatch.setattr(search, "_google_search_uncached", _slow_uncached)
+    monkeypatch.setattr(search, "_SEARCH_CACHE", {})
+
+    async def _run() -> None:
+        semaphore = asyncio.Semaphore(2)
+        _ = await asyncio.gather(*(search.google_search(f"query {i}", semaphore=semaphore) for i in range(5)))
+
+    asyncio.run(_run())
+
+    assert peak == 2
+
+
+def test_default_semaphore_survives_successive_event_loops(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def _slow_uncached(query: str, limit: int, *args: Any) -> dict[str, Any]:
+        await asyncio.sleep(0.001)
+        return {"query": query, "results": []}
+
+    monkeypatch.setattr(search, "_google_search_uncached", _slow_uncached)
+    monkeypatch.setattr(search, "_SEARCH_CACHE", {})
+    monkeypatch.setattr(search, "SEARCH_MAX_CONCURRENCY", 1)
+    monkeypatch.setattr(search, "_SEARCH_SEMAPHORES", search.weakref.WeakKeyDictionary())
+
+    async def _run(batch: int) -> list[dict[str, Any]]:
+        return await asyncio.gather(*(search.google_search(f"query {batch}-{i}") for i in range(3)))
+
+    for batch in range(2):
+        assert len(asyncio.run(_run(batch))) == 3
+
+
+def test_extract_results_tries_the_last_winning_selector_set_first(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(search, "_DOMAIN_WINNING_SET", {})
+    page = _RowsPage([{"title": "A", "link": "https://example.com/a", "snippet": ""}], winner=2)
+
+    _ = asyncio.run(search._extract_results(page, 5))
+    _ = asyncio.run(search._extract_results(page, 5))
+
+    assert page.evaluate_args[0]["order"] == (0, 1, 2, 3)
+    assert page.evaluate_args[1]["order"] == (2, 0, 1, 3)
+    assert search._DOMAIN_WINNING_SET == {"www.google.com": 2}
+
+
+def test_extract_results_demotes_a_winner_that_no_longer_fills_the_page(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(search, "_DOMAIN_WINNING_SET", {"www.google.com": 3})
+    page = _RowsPage([{"title": "A", "link": "https://example.com/a", "snippet": ""}], winner=-1)
+
+    _ = asyncio.run(search._extract_results(page, 5))
+    _ = asyncio.run(search._extract_results(page, 5))
+
+    assert page.evaluate_args[0]["order"] == (3, 0, 1, 2)
+    assert page.evaluate_args[1]["order"] == (0, 1, 2, 3)
+    assert search._DOMAIN_WINNING_SET == {}
+
+
+def test_page_html_cancels_pending_jobs_before_releasing_the_context(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    events: list[str] = []
+
+    class _Page:
+        url = "https://www.google.com/search?q=test"
+
+        async def content(self) -> str:
+            return "<html><body><p>results</p></body></html>"
+
+        async def screenshot(self, **options: Any) -> None:
+            raise search.PlaywrightError("screenshot failed")
+
+    class _Pool:
+        @contextlib.asynccontextmanager
+        async def acquire(self, *args: Any) -> AsyncIterator[tuple[Any, ...]]:
+            try:
+                yield object(), _Page(), {}, tmp_path / "state.json"
+            finally:
+                events.append("released")
+
+    async def _navigate(*args: Any) -> None:
+        pass
+
+    async def _slow_persist(*args: Any) -> None:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            events.append("persist cancelled")
+            raise
+
+    monkeypatch.setattr(search, "get_browser_pool", _Pool)
+    monkeypatch.setattr(search, "_navigate_and_search", _navigate)
+    monkeypatch.setattr(search, "persist_state", _slow_persist)
+
+    result = asyncio.run(
+        search._get_google_search_page_html("test", {}, save_to_file=True, output_path=str(tmp_path / "page.html"))
+    )
+
+    assert result["error"] == "screenshot failed"
+    assert events == ["persist cancelled", "released"]